@@ -1,6 +1,9 @@
-import toml
+try:
+    import tomli_w # much faster TOML writer than the pure-Python toml package
+except ImportError:
+    tomli_w = None
+    import toml
 import os
-import pathlib
 import tempfile
 import time
 import Sofa
@@ -12,6 +15,14 @@ We use the script `blender_importer.py` to import the animation in Blender. This
 runDirName = 'run_' + str(time.strftime("%Y-%m-%H-%M-%S")) 
 outputDir: str = os.path.join(tempfile.gettempdir(), '.sofa_runs', runDirName) + os.sep
 
+def _posix(path):
+    """Forward-slash version of `path` as a str, without allocating a PurePosixPath."""
+    path = str(path)
+    return path.replace(os.sep, '/') if os.sep != '/' else path
+
+# Default location of the meshes, resolved once at import instead of per object
+defaultPrefixPath = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "meshes")
+
 blenderAnimationConfig = {
         'frames': 2500,
         'frequency': 1,
@@ -165,22 +176,20 @@ def addObjectConfig(node, name, template, objectType, meshFilename,
 
     # Handle path
     if prefixPath is None:
-        prefixPath = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "meshes")
-    path = os.path.join(prefixPath, meshFilename)
-    path = pathlib.Path(path).as_posix()
+        prefixPath = defaultPrefixPath
+    path = _posix(os.path.join(prefixPath, meshFilename))
     if not os.path.exists(path + '.obj'):
-        path = meshFilename
-    path = pathlib.Path(path).as_posix()
+        path = _posix(meshFilename)
 
     objectConfig = {
         'mesh': path,
         'type': objectType,
         'name': name,
-        'scale': [float(s) for s in scale]
+        'scale': list(map(float, scale)) # map runs the float conversions in C
     }
 
-    objectConfig['translation'] = [float(t) for t in translation]
-    objectConfig['rotation'] = [float(r) for r in rotation]    
+    objectConfig['translation'] = list(map(float, translation))
+    objectConfig['rotation'] = list(map(float, rotation))
 
     if objectType != 'static':
         objectConfig['monitor'] = os.path.join(outputDir, name + '_x.txt')
@@ -191,7 +200,25 @@ def addObjectConfig(node, name, template, objectType, meshFilename,
     blenderAnimationConfig['objects'].append(objectConfig)
 
 
-def exportAnimationConfig(filename):
+def _endpointDisplacement(monitorFile):
+    """
+    Computes the distance between the first and last recorded positions in a monitor file.
+
+    Returns None when the file is missing or holds fewer than two data lines
+    (e.g. when the configuration is exported before the simulation has run).
+    """
+    try:
+        with open(monitorFile) as f:
+            lines = [l for l in f if l.strip() and not l.startswith('#')]
+    except OSError:
+        return None
+    if len(lines) < 2:
+        return None
+    first = [float(x) for x in lines[0].split()[1:4]]
+    last = [float(x) for x in lines[-1].split()[1:4]]
+    return sum((a - b) ** 2 for a, b in zip(first, last)) ** 0.5
+
+def exportAnimationConfig(filename, motionThreshold=0):
     """
     Exports the global blenderAnimationConfig dictionary to a TOML file for use with Blender importer.
 
@@ -202,8 +229,13 @@ def exportAnimationConfig(filename):
 
     Args:
         filename (str): Name of the output TOML file (e.g., "animation.toml"). The file will
-            be created in the outputDir directory. If the file already exists, it will be 
+            be created in the outputDir directory. If the file already exists, it will be
             overwritten.
+        motionThreshold (float, optional): When > 0 and the monitor files already contain
+            data (i.e. the config is re-exported after a run), objects whose recorded
+            displacement between the first and last frame stays below this value are
+            downgraded to 'static' and their monitor entry is dropped, so the Blender
+            importer skips parsing and animating them entirely. Defaults to 0 (disabled).
 
     Notes:
         - The function checks for mesh file existence by appending '.obj' extension
@@ -227,6 +259,18 @@ def exportAnimationConfig(filename):
     if not os.path.exists(outputDir):
         os.makedirs(outputDir)
 
+    # Downgrade objects that never actually moved: the Blender importer then
+    # treats them as static and skips monitor parsing and animation for them
+    if motionThreshold > 0:
+        for object in blenderAnimationConfig['objects']:
+            monitor = object.get('monitor')
+            if monitor is None or object['type'] == 'static':
+                continue
+            displacement = _endpointDisplacement(monitor)
+            if displacement is not None and displacement < motionThreshold:
+                object['type'] = 'static'
+                del object['monitor']
+
     for object in blenderAnimationConfig['objects']:
         path = object['mesh']
         if not os.path.exists(path+'.obj'):
@@ -234,7 +278,12 @@ def exportAnimationConfig(filename):
             with open(path+'.obj', 'x') as f:
                 continue
 
-    with open(outputDir+filename, 'w+') as f:
-        # Write toml file, overwriting if it exists
-        toml.dump(blenderAnimationConfig, f)
-        f.close()
+    # Write toml file, overwriting if it exists. Serialize in memory first and
+    # write the whole payload in one call: toml/tomli_w dump with many small
+    # writes, each a syscall when the outputDir sits on a network filesystem
+    if tomli_w is not None:
+        payload = tomli_w.dumps(blenderAnimationConfig).encode()
+    else:
+        payload = toml.dumps(blenderAnimationConfig).encode()
+    with open(outputDir+filename, 'wb') as f:
+        f.write(payload)
@@ -7,12 +7,90 @@ We use the script `animation_exporter.py` to generate the TOML file from a SOFA
 
 import bpy
 from math import radians
-from array import array
-from itertools import chain
-from os.path import dirname, realpath, join as path_join, exists
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from os.path import dirname, realpath, join as path_join, exists, getmtime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
+import io
+import mmap
+import os
 import sys
-import toml
+import tempfile
+import numpy as np
+
+try:
+    import pandas as pd # optional: its C parser is several times faster than np.loadtxt
+except ImportError:
+    pd = None
+
+try:
+    import numba # optional: jit-compiled tokenizer, used when pandas is absent
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _parse_rows(buf, ncols, nrows, out):
+        """Fill `out` (nrows x ncols) from the whitespace-separated ASCII bytes
+        in `buf`. Hand-rolled atof running at near-C speed under numba.
+        Returns the number of rows actually parsed, or -1 when a token the
+        parser does not understand (nan/inf, stray text) is hit; the caller
+        falls back to np.loadtxt in that case."""
+        i, n = 0, len(buf)
+        row, col = 0, 0
+        while i < n and row < nrows:
+            while i < n and (buf[i] == 32 or buf[i] == 9 or buf[i] == 13 or buf[i] == 10):
+                i += 1 # skip whitespace and line breaks
+            if i >= n:
+                break
+            start = i
+            sign = 1.0
+            if buf[i] == 45: # '-'
+                sign = -1.0
+                i += 1
+            elif buf[i] == 43: # '+'
+                i += 1
+            val = 0.0
+            while i < n and 48 <= buf[i] <= 57:
+                val = val * 10.0 + (buf[i] - 48)
+                i += 1
+            if i < n and buf[i] == 46: # '.'
+                i += 1
+                frac = 0.1
+                while i < n and 48 <= buf[i] <= 57:
+                    val += (buf[i] - 48) * frac
+                    frac *= 0.1
+                    i += 1
+            if i < n and (buf[i] == 101 or buf[i] == 69): # 'e' / 'E'
+                i += 1
+                esign = 1
+                if i < n and buf[i] == 45:
+                    esign = -1
+                    i += 1
+                elif i < n and buf[i] == 43:
+                    i += 1
+                exp = 0
+                while i < n and 48 <= buf[i] <= 57:
+                    exp = exp * 10 + (buf[i] - 48)
+                    i += 1
+                val *= 10.0 ** (esign * exp)
+            if i == start or (i < n and buf[i] != 32 and buf[i] != 9 and buf[i] != 13 and buf[i] != 10):
+                return -1 # token not consumed cleanly: bail instead of looping
+            out[row, col] = sign * val
+            col += 1
+            if col == ncols:
+                col = 0
+                row += 1
+        return row
+
+try:
+    import tomllib # stdlib, Python 3.11+
+except ImportError:
+    try:
+        import tomli as tomllib # C-accelerated backport
+    except ImportError:
+        tomllib = None
+        import toml # pure-Python fallback, much slower
 
 sys.path.append(dirname(realpath(__file__)))
 
@@ -33,6 +111,43 @@ else:
     }
 
 
+def _savez_atomic(cache, **arrays):
+    """Write an npz cache through a unique temp file and an atomic rename.
+    Several workers can parse the same monitor file concurrently (objects often
+    share a trajectory); racing open(cache, 'wb') calls on one path could
+    persist a truncated archive, whereas os.replace makes the last full write
+    win."""
+    fd, tmp = tempfile.mkstemp(dir=dirname(cache) or '.', suffix='.npz')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, cache)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+_monitor_cache = {}
+_log_buf = []
+def _log(msg=None, force=False):
+    """Buffer log messages and emit them in batches: a print per imported
+    object triggers a synchronous flush and console repaint on some platforms,
+    which stalls large imports.
+    Args:
+        msg (str, optional): Message to append to the buffer. Defaults to None.
+        force (bool, optional): Flush the buffer immediately. Defaults to False.
+    """
+    if msg is not None:
+        _log_buf.append(msg)
+    if (force or len(_log_buf) >= 64) and _log_buf:
+        sys.stdout.write('\n'.join(_log_buf) + '\n')
+        sys.stdout.flush()
+        _log_buf.clear()
+
+
 def parse_monitor_file(path, frequency=1, type='deformable'):
     """Parse a SOFA monitor file to extract time series data for animation.
     Args:
@@ -42,31 +157,85 @@ def parse_monitor_file(path, frequency=1, type='deformable'):
     Returns:
         tuple: A tuple containing:
             - particles_ind (list): List of particle indices.
-            - times (tuple): Tuple of time points.
-            - data (tuple): Tuple of position/rotation data corresponding to each time point.
+            - times (np.ndarray): 1D array of time points.
+            - data: For 'deformable', a (frames, vertices, 3) ndarray of positions.
+              For 'rigid', a tuple of (position, quaternion) pairs per frame.
     """
-    with open(path) as f:
-        # Read header lines
-        l1 = f.readline().strip()
-        nb_part = next(int(x) for x in l1.split() if x.isdigit()) # number of particles
-        l2 = f.readline().strip()
-        particles_ind = [int(x) for x in l2.rsplit(' ', nb_part)[1:]] # particle indices
-        # Read data lines
-        data = f.readlines()
-
-    # Parse data lines
-    res = []
-    data = [l.strip() for l in data if l.strip()]
-    for l in data[::frequency]: # downsample according to frequency
-        time = float(l.split(None, 1)[0]) # extract time
-        d = [float(x) for x in l.split()[1:]] # extract data values
-        if type == 'deformable': # deformable: positions only
-            parts = list(zip(*(d[s::3] for s in range(3))))
-        elif type == 'rigid': # rigid: position + quaternion
-            parts = d[:3], [d[-1]] + d[3:-1]
-        res.append((time, parts))
-    times, data = zip(*res) 
-    return particles_ind, times, data
+    # In-memory memoization: objects sharing the same trajectory file (e.g.
+    # grouped instruments) reuse the parsed arrays by reference
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size, frequency, type)
+    if key in _monitor_cache:
+        return _monitor_cache[key]
+
+    # On-disk cache of the parsed arrays: repeated imports of the same run
+    # (common while iterating on the Blender scene) skip the ASCII parse and
+    # load the binary .npz instead
+    cache = f'{path}.f{frequency}.{type}.npz'
+    if exists(cache) and getmtime(cache) >= getmtime(path):
+        try:
+            z = np.load(cache)
+            data = z['data'] if type == 'deformable' else tuple(zip(z['pos'], z['quat']))
+            _monitor_cache[key] = (list(z['ind']), z['times'], data)
+            return _monitor_cache[key]
+        except Exception:
+            pass # unreadable/partial cache (e.g. left by an older version): re-parse
+
+    # Map the file instead of copying it into a list of str lines: the parser
+    # reads straight from the page cache and peak memory stays near the
+    # size of the resulting array
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # The two header lines hold the particle count and indices
+    header_end = mm.find(b'\n', mm.find(b'\n') + 1) + 1
+    l1, l2 = mm[:header_end].decode().split('\n')[:2]
+    nb_part = next(int(x) for x in l1.split() if x.isdigit()) # number of particles
+    particles_ind = [int(x) for x in l2.strip().rsplit(' ', nb_part)[1:]] # particle indices
+
+    # Parse all data lines at once: the token-to-float conversion runs in C
+    # instead of one float() call per token in a Python loop. Preference order:
+    # pandas (C parser, no warmup), numba (jitted tokenizer, compiled once and
+    # cached on disk), then np.loadtxt
+    # The downsampling happens before the float conversion wherever the parser
+    # allows it, so skipped lines are never tokenized
+    body = mm[header_end:]
+    mm.close()
+    # float32 from the parse onwards: Blender stores keyframe and vertex data
+    # as float anyway, and halving the element size halves the memory
+    # bandwidth of the parse -> foreach_set pipeline
+    raw = None
+    if pd is not None:
+        raw = pd.read_csv(io.BytesIO(body), sep=r'\s+', header=None, comment='#', dtype=np.float32,
+                          skiprows=(lambda i: i % frequency) if frequency > 1 else None).to_numpy()
+    elif numba is not None:
+        ncols = len(body.split(b'\n', 1)[0].split())
+        nrows = body.count(b'\n') + (0 if body.endswith(b'\n') else 1)
+        raw = np.empty((nrows, ncols), dtype=np.float32)
+        nrows = _parse_rows(np.frombuffer(body, dtype=np.uint8), ncols, nrows, raw)
+        # A diverged run writes nan/inf, which the jitted atof rejects: take
+        # the slower loadtxt path rather than caching a garbage parse
+        raw = raw[:nrows:frequency] if nrows >= 0 else None
+    if raw is None:
+        lines = io.BytesIO(body)
+        if frequency > 1:
+            lines = islice(lines, 0, None, frequency) # yield every frequency-th line
+        raw = np.atleast_2d(np.loadtxt(lines, comments='#', dtype=np.float32))
+    times = raw[:, 0] # first column is the time point
+    body = raw[:, 1:] # remaining columns are the values
+    # Contiguous float32 end to end: foreach_set (and the f-curve co storage,
+    # which is float) then copies these buffers in one memcpy instead of
+    # coercing element by element
+    if type == 'deformable': # deformable: positions only
+        data = np.ascontiguousarray(body.reshape(body.shape[0], -1, 3), dtype=np.float32)
+        _savez_atomic(cache, ind=particles_ind, times=times, data=data)
+    elif type == 'rigid': # rigid: position + quaternion (w is stored last in the file)
+        pos = np.ascontiguousarray(body[:, :3], dtype=np.float32)
+        quat = np.ascontiguousarray(np.concatenate([body[:, -1:], body[:, 3:-1]], axis=1), dtype=np.float32)
+        _savez_atomic(cache, ind=particles_ind, times=times, pos=pos, quat=quat)
+        data = tuple(zip(pos, quat))
+    _monitor_cache[key] = (particles_ind, times, data)
+    return _monitor_cache[key]
 
 
 def get_recording_info(path):
@@ -87,6 +256,46 @@ def get_recording_info(path):
     return dict(nb_points=nb_points, step=step, total_time=total_time)
 
 
+def import_mesh_fast(mesh_name):
+    """Import an OBJ mesh by building the datablock directly from arrays.
+    Bypasses the OBJ import operator, which runs through Blender's operator
+    machinery (selection updates, undo push, scene refresh) and costs hundreds
+    of milliseconds per file. Only handles the plain v/f OBJs written by
+    SOFA's MeshExporter.
+    Args:
+        mesh_name (str): Name of the mesh file (without extension).
+    Returns:
+        bpy.types.Object: The created Blender object.
+    Raises:
+        ValueError: If the OBJ carries anything beyond plain v/f geometry.
+    """
+    path = mesh_name + ".obj"
+    with open(path) as f:
+        lines = f.read().splitlines()
+
+    # UVs, normals and material references would be silently lost by this
+    # geometry-only path, so detect them up front and let the operator import
+    # such hand-authored OBJs with all their attributes intact
+    for l in lines:
+        if l.startswith(('vt ', 'vn ', 'usemtl', 'mtllib')) or (l.startswith('f ') and '/' in l):
+            raise ValueError(f"{path} is not a plain v/f OBJ ({l.split()[0]} found)")
+
+    # Vertex coordinates, converted to floats in one C-level pass
+    tokens = [t for l in lines if l.startswith('v ') for t in l.split()[1:4]]
+    verts = np.array(tokens, dtype=np.float32).reshape(-1, 3)
+
+    # Face indices, 1-based in OBJ
+    faces = [[int(t) - 1 for t in l.split()[1:]]
+             for l in lines if l.startswith('f ')]
+
+    mesh = bpy.data.meshes.new(mesh_name)
+    mesh.from_pydata(verts.tolist(), [], faces)
+    mesh.update()
+    obj = bpy.data.objects.new(mesh_name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
 def import_mesh(mesh_name):
     """Import an OBJ mesh into Blender.
     Args:
@@ -96,7 +305,14 @@ def import_mesh(mesh_name):
         - obj (bpy.types.Object): The imported Blender object.
     """
     path = mesh_name + ".obj"
-    print("Importing ", path)
+    _log(f"Importing {path}")
+    try:
+        return import_mesh_fast(mesh_name)
+    except ValueError:
+        # OBJs with UVs, normals or materials: the operator preserves those
+        pass
+    except Exception as e:
+        print("Fast OBJ import failed, falling back to the operator:", e, file=sys.stderr)
     if BLENDER_4:
         bpy.ops.wm.obj_import(filepath=path, **import_options)
         obj = bpy.context.selected_objects[0]
@@ -126,52 +342,51 @@ def add_animation_rigid(obj, times, data):
         times (tuple): Tuple of time points.
         data (tuple): Tuple of position/rotation data corresponding to each time point.
     """
-    if not times or not data:
+    if not len(times) or not len(data):
         return
 
     n = len(times)
     obj.rotation_mode = 'QUATERNION'
 
-    # Extract per-frame positions and quaternions
-    positions = [p for p, q in data]
-    quaternions = [q for p, q in data]
-
-    # Transpose to per-axis sequences (fast, in C)
-    xs, ys, zs = zip(*positions)
-    q0, q1, q2, q3 = zip(*quaternions)
-
-    # Frames as floats 1..n
-    frames = tuple(float(i) for i in range(1, n + 1))
+    # Stack per-frame positions and quaternions into (n, 3) and (n, 4) arrays
+    positions = np.stack([p for p, q in data])
+    quaternions = np.stack([q for p, q in data])
 
     # Create a new action and f-curves
     action = bpy.data.actions.new(f"{obj.name}_RigidAnim")
+    # Scope each curve in an action group: uniqueness checks on later
+    # fcurves.new calls then scan the group instead of the whole action
+    loc_group = action.groups.new(name="location")
+    rot_group = action.groups.new(name="rotation")
     loc_fcurves = [action.fcurves.new(data_path="location", index=i) for i in range(3)]
     rot_fcurves = [action.fcurves.new(data_path="rotation_quaternion", index=i) for i in range(4)]
+    for fcu in loc_fcurves:
+        fcu.group = loc_group
+    for fcu in rot_fcurves:
+        fcu.group = rot_group
 
-    # Helper to build interleaved (frame, value) array quickly
-    def build_co_array(values):
-        return array('f', chain.from_iterable(zip(frames, values)))
+    # Interleaved (frame, value) buffer shared across all f-curves: foreach_set
+    # consumes it through the buffer protocol in a single memcpy
+    buf = np.empty(2 * n, dtype=np.float32)
+    buf[0::2] = np.arange(1, n + 1, dtype=np.float32)
 
-    co_x = build_co_array(xs)
-    co_y = build_co_array(ys)
-    co_z = build_co_array(zs)
-    co_q0 = build_co_array(q0)
-    co_q1 = build_co_array(q1)
-    co_q2 = build_co_array(q2)
-    co_q3 = build_co_array(q3)
+    # With one keyframe per frame Bezier handles are both wrong and expensive
+    # to recompute; linear interpolation skips the O(n) handle pass on update()
+    interp = np.full(n, 1, dtype=np.int32) # 1 = LINEAR
 
-    # Pre-allocate keyframe points and assign in batch
-    for fcu in loc_fcurves + rot_fcurves:
+    for axis, fcu in enumerate(loc_fcurves):
         fcu.keyframe_points.add(n)
+        buf[1::2] = positions[:, axis]
+        fcu.keyframe_points.foreach_set("co", buf)
+        fcu.keyframe_points.foreach_set("interpolation", interp)
+        fcu.update()
 
-    loc_fcurves[0].keyframe_points.foreach_set("co", co_x)
-    loc_fcurves[1].keyframe_points.foreach_set("co", co_y)
-    loc_fcurves[2].keyframe_points.foreach_set("co", co_z)
-
-    rot_fcurves[0].keyframe_points.foreach_set("co", co_q0)
-    rot_fcurves[1].keyframe_points.foreach_set("co", co_q1)
-    rot_fcurves[2].keyframe_points.foreach_set("co", co_q2)
-    rot_fcurves[3].keyframe_points.foreach_set("co", co_q3)
+    for axis, fcu in enumerate(rot_fcurves):
+        fcu.keyframe_points.add(n)
+        buf[1::2] = quaternions[:, axis]
+        fcu.keyframe_points.foreach_set("co", buf)
+        fcu.keyframe_points.foreach_set("interpolation", interp)
+        fcu.update()
 
     # Assign action to object animation data
     obj.animation_data_create()
@@ -179,42 +394,79 @@ def add_animation_rigid(obj, times, data):
 
 
 def add_animation_deformable(obj, indices, times, data):
-    """Add deformable mesh animation keyframes to a Blender mesh.
-    Args:       
+    """Add deformable mesh animation to a Blender mesh using shape keys.
+    One shape key is created per frame and a single value f-curve with constant
+    interpolation switches between them. This keeps Blender's per-frame
+    evaluation at one shape-key blend instead of O(vertices) f-curve lookups,
+    which does not scale for large meshes (3 f-curves per vertex).
+    Args:
         obj (bpy.types.Object): The Blender object to animate.
         indices (list): List of vertex indices to animate.
-        times (tuple): Tuple of time points.
-        data (tuple): Tuple of position data corresponding to each time point.
+        times (np.ndarray): 1D array of time points.
+        data (np.ndarray): (frames, vertices, 3) array of positions per time point.
     """
     mesh = obj.data
-    mesh.animation_data_create() # Ensure animation data exists
-    action = bpy.data.actions.new("MeshAnimation") # Create a new action for the mesh
-    
-    data_path = "vertices[%d].co" # Data path template for vertex coordinates
-    
-    for vertex_id, positions in zip(indices, zip(*data)):
-        n = len(positions)
-        frames = tuple(float(i) for i in range(1, n + 1))
-
-        # transpose positions -> three tuples: xs, ys, zs
-        xs, ys, zs = zip(*positions)
-
-        # build compact float arrays interleaving (frame, value)
-        co_x = array('f', chain.from_iterable(zip(frames, xs)))
-        co_y = array('f', chain.from_iterable(zip(frames, ys)))
-        co_z = array('f', chain.from_iterable(zip(frames, zs)))
-
-        # create F-curves and pre-add keyframe points
-        fcu_x, fcu_y, fcu_z = [action.fcurves.new(data_path % vertex_id, index=i) for i in range(3)]
-        for fcu in (fcu_x, fcu_y, fcu_z):
-            fcu.keyframe_points.add(n)
-
-        # apply in main thread with foreach_set
-        fcu_x.keyframe_points.foreach_set("co", co_x)
-        fcu_y.keyframe_points.foreach_set("co", co_y)
-        fcu_z.keyframe_points.foreach_set("co", co_z)
-    
-    mesh.animation_data.action = action # Assign the action to the mesh
+    data = np.asarray(data) # (frames, vertices, 3)
+    n = data.shape[0]
+    indices = np.asarray(indices, dtype=np.intp)
+
+    # Keep vertex indices ascending (with the data columns permuted to match)
+    # so the per-frame scatter into the position buffer stays monotonic
+    order = np.argsort(indices)
+    if not np.array_equal(order, np.arange(len(indices))):
+        indices = indices[order]
+        data = data[:, order]
+
+    # Rest positions: vertices that are not monitored keep their imported coordinates
+    rest = np.empty(3 * len(mesh.vertices), dtype=np.float32)
+    mesh.vertices.foreach_get('co', rest)
+    rest = rest.reshape(-1, 3)
+
+    obj.shape_key_add(name='Basis')
+    mesh.shape_keys.animation_data_create() # Ensure animation data exists
+    action = bpy.data.actions.new("MeshAnimation") # Create a new action for the shape keys
+
+    positions = rest.copy()
+    flat = positions.reshape(-1) # view shared across all frames
+
+    # Keyframe buffers hoisted out of the loop: only the frame slots change.
+    # The last key gets no closing (frame + 1, 0) point: constant extrapolation
+    # then holds it at 1, so the mesh keeps the final recorded pose instead of
+    # snapping back to the rest mesh when the timeline runs past the recording
+    co_first = np.array([1.0, 1.0, 2.0, 0.0], dtype=np.float32)
+    co_last = np.array([1.0, 0.0, 0.0, 1.0], dtype=np.float32)
+    co_only = np.array([1.0, 1.0], dtype=np.float32)
+    co_rest = np.array([1.0, 0.0, 0.0, 1.0, 0.0, 0.0], dtype=np.float32)
+    interp1 = np.zeros(1, dtype=np.int32) # 0 = CONSTANT
+    interp2 = np.zeros(2, dtype=np.int32)
+    interp3 = np.zeros(3, dtype=np.int32)
+
+    for frame in range(1, n + 1):
+        # One shape key per frame, filled in batch
+        positions[indices] = data[frame - 1]
+        sk = obj.shape_key_add(name=f'f{frame}')
+        sk.data.foreach_set('co', flat)
+
+        # Animate the key value: 1 on its frame, 0 everywhere else, with
+        # constant interpolation so exactly one key is active at a time
+        if n == 1:
+            co, interp = co_only, interp1
+        elif frame == 1:
+            co, interp = co_first, interp2
+        elif frame == n:
+            co_last[2] = frame
+            co, interp = co_last, interp2
+        else:
+            co_rest[2] = frame
+            co_rest[4] = frame + 1
+            co, interp = co_rest, interp3
+        fcu = action.fcurves.new(f'key_blocks["{sk.name}"].value')
+        fcu.keyframe_points.add(len(interp))
+        fcu.keyframe_points.foreach_set('co', co)
+        fcu.keyframe_points.foreach_set('interpolation', interp)
+        fcu.update()
+
+    mesh.shape_keys.animation_data.action = action # Assign the action to the shape keys
 
 
 _mesh_cache = {}
@@ -244,11 +496,11 @@ def _process_object(config_obj, config_dir, frequency):
     
     # Parse monitor file
     if obj_type != 'static':
-        filename = config_obj['monitor'] 
+        filename = config_obj['monitor']
         if not exists(filename):
             filename = path_join(config_dir, filename)
         indices, times, data = parse_monitor_file(filename, frequency, type=obj_type)
-    
+
         # Return data needed for animation setup
         return {
             'mesh_name': mesh_name,
@@ -259,7 +511,8 @@ def _process_object(config_obj, config_dir, frequency):
             'rotation': config_obj.get('rotation', [0, 0, 0]),
             'indices': indices,
             'times': times,
-            'data': data
+            'data': data,
+            'monitor_key': (filename, frequency, obj_type) # identifies the trajectory
         }
     else:
         return {
@@ -273,21 +526,33 @@ def _process_object(config_obj, config_dir, frequency):
 
     
 
+# Actions already built for a given trajectory, shared across objects instead
+# of rebuilding (and storing) identical f-curve buffers per object
+_action_cache = {}
+# (mesh, trajectory) pairs whose shape keys are already set up: objects linked
+# to the same mesh datablock share its shape keys for free
+_shape_key_cache = set()
+
 def import_scene(config_path, frame_start=None, num_workers=16):
     """Import a scene into Blender based on a TOML configuration file.
     Args:
         config_path (str): Path to the TOML configuration file.
         frame_start (int, optional): Starting frame number for the animation. Defaults to None.
     """
-    print("Importing Scene", config_path)
+    _log(f"Importing Scene {config_path}", force=True)
     config_dir = dirname(config_path)
-    config = toml.load(config_path) # Load TOML configuration
+    # Load TOML configuration
+    if tomllib is not None:
+        with open(config_path, 'rb') as f:
+            config = tomllib.load(f)
+    else:
+        config = toml.load(config_path)
     frequency = 1
 
     if not len(config.get('objects', [])):
-        print("No object in the toml")
+        _log("No object in the toml", force=True)
         exit(1)
-    print("Loaded config file, found ", len(config.get('objects', [])), " objects")
+    _log(f"Loaded config file, found {len(config.get('objects', []))} objects")
 
     # Determine frame count from first object's monitor file
     for object in config.get('objects', []):
@@ -299,10 +564,20 @@ def import_scene(config_path, frame_start=None, num_workers=16):
                 break
 
     init_anim(frames, frame_start) # Initialize animation frame range
-    print(f'Importing {int(frames)} animation frames', file=sys.stdout, flush=True)
-
-    # Parallel monitor file parsing
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+    _log(f'Importing {int(frames)} animation frames', force=True)
+
+    # Parallel monitor file parsing. The workers never touch bpy, so they can
+    # run in separate processes and sidestep the GIL. Fork is required: under
+    # spawn the workers would re-import this script outside Blender. Only Linux
+    # qualifies — macOS offers fork too, but forking a Cocoa app like Blender
+    # aborts in the Objective-C runtime. Elsewhere fall back to threads, which
+    # still overlap since np.loadtxt releases the GIL.
+    if sys.platform.startswith('linux'):
+        executor = ProcessPoolExecutor(max_workers=num_workers,
+                                       mp_context=multiprocessing.get_context('fork'))
+    else:
+        executor = ThreadPoolExecutor(max_workers=num_workers)
+    with executor:
         futures = {executor.submit(_process_object, cfg, config_dir, frequency): cfg
                for cfg in config.get('objects', [])}
 
@@ -333,11 +608,26 @@ def import_scene(config_path, frame_start=None, num_workers=16):
                 obj.delta_rotation_euler = rotation
 
                 if result['obj_type'] == 'deformable':
-                    add_animation_deformable(obj, result['indices'], result['times'], result['data'])
+                    cache_key = (result['mesh_name'], result['monitor_key'])
+                    if cache_key not in _shape_key_cache:
+                        add_animation_deformable(obj, result['indices'], result['times'], result['data'])
+                        _shape_key_cache.add(cache_key)
                 elif result['obj_type'] == 'rigid':
-                    add_animation_rigid(obj, result['times'], result['data'])
+                    action = _action_cache.get(result['monitor_key'])
+                    if action is None:
+                        add_animation_rigid(obj, result['times'], result['data'])
+                        if obj.animation_data is not None:
+                            _action_cache[result['monitor_key']] = obj.animation_data.action
+                    else:
+                        # the shared action drives rotation_quaternion curves,
+                        # which a fresh object (euler mode by default) would ignore
+                        obj.rotation_mode = 'QUATERNION'
+                        obj.animation_data_create()
+                        obj.animation_data.action = action
             
-            print(f"Imported {obj.name}")
+            _log(f"Imported {obj.name}")
+
+    _log(force=True) # flush whatever is left in the buffer
 
 
 def usage():